@@ -1,10 +1,19 @@
 import argparse
+import fileinput
 import re
 import os
 import subprocess
 
 # Configuration
 VERSION_FILE = "VERSION"
+
+# Regex to catch version, __version__, and __plugin_version__
+# Compiled once at import time; the version itself is matched generically and
+# compared against the old version in the sub callback.
+_VER_PATTERN = re.compile(
+    r'((?:version|__version__|__plugin_version__)\s*=\s*)(["\'])([^"\']+)(["\'])'
+)
+
 TARGET_FILES = [
     VERSION_FILE,
     "octoprint_reconnect_guru/__init__.py",
@@ -26,22 +35,22 @@ def bump_version(current, part):
     return f"{major}.{minor}.{patch}"
 
 def update_files(old_v, new_v):
-    # Regex to catch version, __version__, and __plugin_version__
-    pattern = re.compile(
-        rf'((?:version|__version__|__plugin_version__)\s*=\s*)(["\']){re.escape(old_v)}(["\'])'
-    )
-
-    for file_path in TARGET_FILES:
-        if not os.path.exists(file_path): continue
-
-        if file_path == VERSION_FILE:
-            new_content = new_v
-        else:
-            with open(file_path, "r") as f: content = f.read()
-            new_content = pattern.sub(rf'\g<1>\g<2>{new_v}\g<3>', content)
-
-        with open(file_path, "w") as f:
-            f.write(new_content)
+    def replace(m):
+        if m.group(3) != old_v:
+            return m.group(0)
+        return f'{m.group(1)}{m.group(2)}{new_v}{m.group(4)}'
+
+    # The VERSION file is just the version string; write it directly
+    with open(VERSION_FILE, "w") as f:
+        f.write(new_v)
+
+    # Rewrite the source files line by line in place rather than slurping
+    # the whole file and building a second copy in memory
+    source_files = [f for f in TARGET_FILES if f != VERSION_FILE and os.path.exists(f)]
+    if source_files:
+        with fileinput.input(source_files, inplace=True) as lines:
+            for line in lines:
+                print(_VER_PATTERN.sub(replace, line), end="")
 
 def tag(new_v):
     try:
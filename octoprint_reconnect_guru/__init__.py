@@ -1,8 +1,9 @@
 import time
 import logging
 import os
+import queue
 import threading
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 import pyudev
 import serial
@@ -16,6 +17,18 @@ from octoprint.plugin import (
 )
 from octoprint.events import Events
 
+# Only process one add event per device within this window; composite USB
+# devices emit several tty add events within milliseconds of each other
+_DEBOUNCE_SECONDS = 0.2
+_DEBOUNCE_PRUNE_SECONDS = 5.0
+
+# Events worth logging; everything else (ZChange etc.) is ignored outright
+_EVENT_MESSAGES = {
+    Events.CONNECTED: "Printer connected",
+    Events.DISCONNECTED: "Printer disconnected",
+    Events.ERROR: "Printer error",
+}
+
 class NullLogger:
     def section(self, *_, **__): pass
     def subsection(self, *_, **__): pass
@@ -28,35 +41,38 @@ class NullLogger:
     def kv(self, *_, **__): pass
 
 class PluginLogger:
+    # Messages are passed to the stdlib logger as %s-style lazy arguments so
+    # nothing is formatted when the record would be discarded anyway
+
     def __init__(self, logger):
         self._logger = logger
 
     def section(self, title):
-        self._logger.info(f"=== {title} ===")
+        self._logger.info("=== %s ===", title)
 
     def subsection(self, title):
-        self._logger.info(f"--- {title} ---")
+        self._logger.info("--- %s ---", title)
 
     def event(self, message):
-        self._logger.info(f">> {message} <<")
+        self._logger.info(">> %s <<", message)
 
     def highlight(self, message):
-        self._logger.info(f"*** {message} ***")
+        self._logger.info("*** %s ***", message)
 
-    def info(self, message):
-        self._logger.info(f"{message}")
+    def info(self, message, *args):
+        self._logger.info(message, *args)
 
-    def debug(self, message):
-        self._logger.debug(f"{message}")
+    def debug(self, message, *args):
+        self._logger.debug(message, *args)
 
-    def warning(self, message):
-        self._logger.warning(f"{message}")
+    def warning(self, message, *args):
+        self._logger.warning(message, *args)
 
-    def error(self, message):
-        self._logger.error(f"{message}")
+    def error(self, message, *args):
+        self._logger.error(message, *args)
 
     def kv(self, key, value):
-        self._logger.info(f"[{key}] {value}")
+        self._logger.info("[%s] %s", key, value)
 
 class ReconnectGuruPlugin(
     SettingsPlugin,
@@ -68,7 +84,12 @@ class ReconnectGuruPlugin(
     def __init__(self):
         self._monitor = None
         self._monitor_thread = None
-        self._stop_monitoring = False
+        self._worker_thread = None
+        self._connect_queue = queue.PriorityQueue()
+        self._stop_event = threading.Event()
+        self._filters = None
+        self._recent = {}
+        self._log_listener = None
         self.log = NullLogger()
 
     # -------------------------------------------------------------------------
@@ -94,12 +115,20 @@ class ReconnectGuruPlugin(
         file_handler.setFormatter(formatter)
         file_handler.setLevel(logging.DEBUG)
 
-        self._logger.addHandler(file_handler)
+        # Keep disk I/O off the threads doing the logging: records only get
+        # queued here, and the file handler runs on the listener thread
+        log_queue = queue.SimpleQueue()
+        self._logger.addHandler(QueueHandler(log_queue))
         self._logger.setLevel(logging.DEBUG)
         self._logger.propagate = False
 
+        self._log_listener = QueueListener(log_queue, file_handler)
+        self._log_listener.start()
+
         self.log = PluginLogger(self._logger)
 
+        self._refresh_filter_cache()
+
         self.log.section("ReconnectGuru Plugin Initialized")
         self.log.kv("Log file", logging_path)
         self.print_settings()
@@ -125,10 +154,21 @@ class ReconnectGuruPlugin(
     def on_settings_save(self, data):
         SettingsPlugin.on_settings_save(self, data)
 
+        self._refresh_filter_cache()
+
         self.log.section("Settings Saved")
         self.log.info(f"Raw data: {data}")
         self.print_settings()
 
+    def _refresh_filter_cache(self):
+        """Re-read the device filters from settings; called on init and save"""
+        self._filters = (
+            self._settings.get(["filter_vendor_id"]).strip(),
+            self._settings.get(["filter_product_id"]).strip(),
+            self._settings.get(["filter_serial"]).strip(),
+            self._settings.get(["filter_port"]).strip(),
+        )
+
     def print_settings(self):
         self.log.kv("Enabled", self._settings.get_boolean(["enabled"]))
         self.log.kv(
@@ -160,53 +200,56 @@ class ReconnectGuruPlugin(
         self.log.section("Shutting down")
         self._stop_udev_monitor()
 
+        # Flush any queued records and stop the listener thread last
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+
     # -------------------------------------------------------------------------
     # Events
     # -------------------------------------------------------------------------
 
     def on_event(self, event, payload):
         # Log significant events only
-        significant_events = {
-            Events.CONNECTED,
-            Events.DISCONNECTED,
-            Events.ERROR,
-        }
-
-        if event in significant_events:
-            self.log.section(f"Event: {event}")
-
-        if event == Events.CONNECTED:
-            self.log.event("Printer connected")
-        elif event == Events.DISCONNECTED:
-            self.log.event("Printer disconnected")
-        elif event == Events.ERROR:
-            self.log.event("Printer error")
+        message = _EVENT_MESSAGES.get(event)
+        if message is None:
+            return
+
+        self.log.section(f"Event: {event}")
+        self.log.event(message)
 
     # -------------------------------------------------------------------------
     # udev Monitoring
     # -------------------------------------------------------------------------
 
     def _start_udev_monitor(self):
-        """Start the udev monitoring thread"""
+        """Start the udev monitoring and connection worker threads"""
         if self._monitor_thread and self._monitor_thread.is_alive():
             self.log.warning("Monitor thread already running")
             return
 
-        self._stop_monitoring = False
+        self._stop_event.clear()
         self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._monitor_thread.start()
+        self._worker_thread = threading.Thread(target=self._connection_worker, daemon=True)
+        self._worker_thread.start()
         self.log.highlight("udev monitor thread started")
 
     def _stop_udev_monitor(self):
-        """Stop the udev monitoring thread"""
+        """Stop the udev monitoring and connection worker threads"""
         if not self._monitor_thread:
             return
 
         self.log.info("Stopping udev monitor")
-        self._stop_monitoring = True
+        self._stop_event.set()
+
+        # Wake the worker if it is blocked waiting for a queue item
+        self._connect_queue.put((0, None))
 
         if self._monitor_thread.is_alive():
             self._monitor_thread.join(timeout=5)
+        if self._worker_thread and self._worker_thread.is_alive():
+            self._worker_thread.join(timeout=5)
 
         self._monitor = None
         self.log.info("udev monitor stopped")
@@ -221,7 +264,7 @@ class ReconnectGuruPlugin(
             self.log.info("Listening for USB device add events...")
 
             for device in iter(self._monitor.poll, None):
-                if self._stop_monitoring:
+                if self._stop_event.is_set():
                     break
 
                 if device.action == 'add':
@@ -245,18 +288,25 @@ class ReconnectGuruPlugin(
             usb_path = device.get('ID_PATH', 'N/A')
             device_node = device.device_node
 
+            # Debounce bursts of add events from the same physical device
+            now = time.monotonic()
+            key = (vendor, product, serial_num)
+            if now - self._recent.get(key, 0) < _DEBOUNCE_SECONDS:
+                self.log.debug("Debounced duplicate add event for %s", device_node)
+                return
+            self._recent[key] = now
+
+            # Drop stale entries so the debounce map does not grow unbounded
+            self._recent = {
+                k: t for k, t in self._recent.items()
+                if now - t < _DEBOUNCE_PRUNE_SECONDS
+            }
+
             # Extract port from USB path
             # USB paths follow format: platform-XXXX-usb-BUS:PORT:INTERFACE
             # We want the PORT part (e.g., "1.2" or "1.1.3")
-            port = "Unknown"
-            if ":" in usb_path:
-                try:
-                    # Split by colons, second element is the port
-                    parts = usb_path.split(":")
-                    if len(parts) >= 2:
-                        port = parts[1]
-                except (IndexError, ValueError):
-                    port = "Unknown"
+            _, sep, rest = usb_path.partition(":")
+            port = rest.partition(":")[0] if sep else "Unknown"
 
             self.log.section("USB Device Added")
             self.log.kv("Device Node", device_node)
@@ -278,10 +328,9 @@ class ReconnectGuruPlugin(
 
     def _device_matches_filters(self, vendor, product, serial_num, port):
         """Check if device matches configured filters"""
-        filter_vendor = self._settings.get(["filter_vendor_id"]).strip()
-        filter_product = self._settings.get(["filter_product_id"]).strip()
-        filter_serial = self._settings.get(["filter_serial"]).strip()
-        filter_port = self._settings.get(["filter_port"]).strip()
+        if self._filters is None:
+            self._refresh_filter_cache()
+        filter_vendor, filter_product, filter_serial, filter_port = self._filters
 
         # If all filters are empty, match any device
         if not any([filter_vendor, filter_product, filter_serial, filter_port]):
@@ -290,19 +339,19 @@ class ReconnectGuruPlugin(
 
         # Check each configured filter
         if filter_vendor and vendor != filter_vendor:
-            self.log.debug(f"Vendor mismatch: {vendor} != {filter_vendor}")
+            self.log.debug("Vendor mismatch: %s != %s", vendor, filter_vendor)
             return False
 
         if filter_product and product != filter_product:
-            self.log.debug(f"Product mismatch: {product} != {filter_product}")
+            self.log.debug("Product mismatch: %s != %s", product, filter_product)
             return False
 
         if filter_serial and serial_num != filter_serial:
-            self.log.debug(f"Serial mismatch: {serial_num} != {filter_serial}")
+            self.log.debug("Serial mismatch: %s != %s", serial_num, filter_serial)
             return False
 
         if filter_port and port != filter_port:
-            self.log.debug(f"Port mismatch: {port} != {filter_port}")
+            self.log.debug("Port mismatch: %s != %s", port, filter_port)
             return False
 
         return True
@@ -312,13 +361,34 @@ class ReconnectGuruPlugin(
         delay = self._settings.get_int(["connect_delay_seconds"])
         self.log.kv("Scheduling connection in", f"{delay} seconds")
 
-        def delayed_connect():
-            time.sleep(delay)
-            if not self._stop_monitoring:
-                self._attempt_connection(device_node)
+        self._connect_queue.put((time.monotonic() + delay, device_node))
+
+    def _connection_worker(self):
+        """Single worker thread servicing scheduled connection attempts"""
+        while not self._stop_event.is_set():
+            deadline, device_node = self._connect_queue.get()
+            if device_node is None:
+                # Sentinel pushed on shutdown
+                break
+
+            # Wait out the remaining delay, aborting promptly on shutdown
+            remaining = deadline - time.monotonic()
+            if remaining > 0 and self._stop_event.wait(remaining):
+                break
 
-        thread = threading.Thread(target=delayed_connect, daemon=True)
-        thread.start()
+            self._attempt_connection(device_node)
+
+    def _port_is_openable(self, device_node):
+        """Check the device node can be opened, without blocking on termios
+        setup the way a full serial.Serial open does"""
+        try:
+            fd = os.open(device_node, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+        except OSError as e:
+            self.log.error(f"Failed to test port: {e}")
+            return False
+
+        os.close(fd)
+        return True
 
     def _attempt_connection(self, device_node):
         """Attempt to connect OctoPrint to the device"""
@@ -332,30 +402,25 @@ class ReconnectGuruPlugin(
                 return
 
             # Verify port exists and is accessible
-            try:
-                baudrate = self._settings.global_get_int(["serial", "baudrate"])
-                if baudrate:
-                    test_serial = serial.Serial(device_node, baudrate, timeout=1)
-                else:
-                    test_serial = serial.Serial(device_node, timeout=1)
-
-                if test_serial.is_open:
-                    # naughtily send a little message on connect
-                    if self._settings.get_boolean(["message_on_connect"]):
-                        self.log.info("Sending M117 connect message")
-                        #test_serial.write(b"G4 1000\n")
-                        #test_serial.write(b"M117 Connecting...\n")
-                        #test_serial.write(b"G4 1000\n")
-                        test_serial.write(f"M117 [{device_node}]\n".encode('ascii'))
-                        #test_serial.write(b"G4 1000\n")
-                    test_serial.close()
-                    self.log.info("Port is accessible")
-                else:
-                    self.log.error("Port failed to open")
-                    return
-            except Exception as e:
-                self.log.error(f"Failed to test port: {e}")
+            if not self._port_is_openable(device_node):
                 return
+            self.log.info("Port is accessible")
+
+            # naughtily send a little message on connect; only this branch
+            # needs a real serial port with baud negotiation
+            if self._settings.get_boolean(["message_on_connect"]):
+                try:
+                    baudrate = self._settings.global_get_int(["serial", "baudrate"])
+                    if baudrate:
+                        test_serial = serial.Serial(device_node, baudrate, timeout=1)
+                    else:
+                        test_serial = serial.Serial(device_node, timeout=1)
+
+                    self.log.info("Sending M117 connect message")
+                    test_serial.write(f"M117 [{device_node}]\n".encode('ascii'))
+                    test_serial.close()
+                except Exception as e:
+                    self.log.error(f"Failed to send connect message: {e}")
 
             # Get printer profile
             printer_profile = self._printer_profile_manager.get_default()